@@ -1,46 +1,553 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import ccxt
-import requests
+import aiohttp
+import asyncio
+import atexit
+import copy
+import csv
+import functools
+import hashlib
+import inspect
+import logging
+import math
+import os
+import threading
 import time
-from typing import Dict, List, Optional
-
-class GeckoTerminalClient:
-    def __init__(self):
-        self.base_url = "https://api.geckoterminal.com/api/v2"
-        self.session = requests.Session()
-        self.rate_limit = 30  # calls per minute
-        self.calls = []
-
-    def _rate_limit_check(self):
-        """Enforce rate limiting: 30 calls per minute."""
-        current_time = time.time()
-        self.calls = [call for call in self.calls if current_time - call < 60]
-        if len(self.calls) >= self.rate_limit:
-            sleep_time = 60 - (current_time - self.calls[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        self.calls.append(current_time)
-
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make an API request with rate limiting."""
-        self._rate_limit_check()
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+class FileCache:
+    """JSON-file cache for decoded API payloads with a per-entry time to live.
+
+    Files not rewritten for ``max_age`` seconds are pruned, as are the oldest
+    files once the directory grows past ``max_bytes``; this bounds entries
+    that never expire and the expired ones kept around for ETag revalidation.
+    """
+
+    prune_every = 100  # writes between pruning passes
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 2**20, max_age: float = 30 * 86400):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._writes = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self.prune()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any, Optional[str]]]:
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = _json_loads(f.read())
+            expires = entry["expires"]
+            return math.inf if expires is None else expires, entry["value"], entry["etag"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._load(key)
+        if entry is None or entry[0] < time.time():
+            return None
+        return entry[1]
+
+    def get_stale(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """Return ``(value, etag)`` even if expired, for revalidating with the server."""
+        entry = self._load(key)
+        if entry is None:
+            return None, None
+        return entry[1], entry[2]
+
+    def set(self, key: str, value: Any, ttl: float, etag: Optional[str] = None):
+        """Store ``value`` for ``ttl`` seconds (``math.inf`` never expires)."""
+        expires = None if math.isinf(ttl) else time.time() + ttl
+        data = _json_dumps({"expires": expires, "etag": etag, "value": value})
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._writes += 1
+        if self._writes % self.prune_every == 0:
+            self.prune()
+
+    def prune(self):
+        """Drop entries older than ``max_age``, then the oldest beyond ``max_bytes``."""
+        now = time.time()
+        entries = []
+        with os.scandir(self.directory) as it:
+            for item in it:
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    stat = item.stat()
+                    if now - stat.st_mtime > self.max_age:
+                        os.remove(item.path)
+                    else:
+                        entries.append((stat.st_mtime, stat.st_size, item.path))
+                except OSError:
+                    continue
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
+# Cached in place of a payload for requests that came back with no data.
+_MISSING = {"__missing__": True}
+
+# Columns of the pool metrics DataFrame returned by the multi-pool endpoint.
+_METRICS_COLUMNS = ['network', 'pool_address', 'tvl_usd', 'volume_24h_usd', 'fetch_timestamp']
+
+# Record layout of the candles returned by GeckoTerminalClient.fetch_pool_ohlcv.
+OHLCV_DTYPE = np.dtype([
+    ('ts', 'i8'), ('o', 'f8'), ('h', 'f8'), ('l', 'f8'), ('c', 'f8'), ('v', 'f8')
+])
+
+
+def ohlcv_to_dataframe(ohlcv: np.ndarray) -> pd.DataFrame:
+    """Convert an ``OHLCV_DTYPE`` record array to a timestamped OHLCV DataFrame."""
+    return pd.DataFrame({
+        'timestamp': ohlcv['ts'],
+        'datetime': ohlcv['ts'].view('datetime64[s]'),
+        'open': ohlcv['o'],
+        'high': ohlcv['h'],
+        'low': ohlcv['l'],
+        'close': ohlcv['c'],
+        'volume': ohlcv['v']
+    })
+
+
+def _as_float(value: Any) -> float:
+    """Parse a numeric API field, mapping null or malformed values to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _write_csv(path: str, header: Tuple[str, ...], rows: List[Tuple]):
+    """Write ``rows`` to ``path`` via a temp file, so readers never see a partial CSV."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header)
+        writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+# Statuses worth retrying with backoff rather than reporting straight away.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# One keep-alive connection pool per event loop, shared by every client session
+# on that loop: [connector, number of open sessions using it].
+_shared_connectors: Dict[asyncio.AbstractEventLoop, List[Any]] = {}
+
+
+def _acquire_connector() -> aiohttp.TCPConnector:
+    """Return the running loop's shared connection pool, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    entry = _shared_connectors.get(loop)
+    if entry is None:
+        connector = aiohttp.TCPConnector(
+            limit=100, limit_per_host=50, ttl_dns_cache=300, keepalive_timeout=30
+        )
+        entry = _shared_connectors[loop] = [connector, 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_connector():
+    """Drop one reference to the loop's shared pool, closing it with the last one."""
+    loop = asyncio.get_running_loop()
+    entry = _shared_connectors.get(loop)
+    if entry is None:  # already closed at interpreter exit
+        return
+    entry[1] -= 1
+    if entry[1] == 0:
+        del _shared_connectors[loop]
+        await entry[0].close()
+
+
+# Event loop on a daemon thread that runs every *_sync call, so sessions and the
+# shared connection pool stay open between calls.
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the background loop used by the sync wrappers, starting it if needed."""
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="lp-modeling-http", daemon=True).start()
+            atexit.register(_stop_background_loop, loop)
+            _background_loop = loop
+    return _background_loop
+
+
+def _stop_background_loop(loop: asyncio.AbstractEventLoop):
+    """Close the background loop's shared connection pool and stop the loop."""
+    entry = _shared_connectors.pop(loop, None)
+    if entry is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(entry[0].close(), loop).result(timeout=5)
+        except Exception:
+            logger.debug("Error closing background connection pool", exc_info=True)
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def memoize_with_injection(key: Optional[Callable[..., Hashable]] = None, ttl: float = math.inf):
+    """Memoize an async client method in-process for ``ttl`` seconds.
+
+    Results are keyed by ``key(self, *args, **kwargs)`` (by default, all bound
+    arguments) and kept on the client's ``_memo``, an LRU of at most
+    ``memo_maxsize`` entries across all memoized methods; expired entries are
+    dropped when found. ``None`` results are not memoized. Callers always get
+    a shallow copy, so mutating a result cannot change what later calls
+    return. ``method.inject(client, result, *args, **kwargs)`` seeds the memo
+    with data the caller already holds, so the first call skips the fetch.
+    """
+    def decorator(method):
+        name = method.__name__
+        signature = inspect.signature(method)
+
+        def memo_key(self, args, kwargs) -> Tuple:
+            if key is not None:
+                return name, key(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return name, tuple(bound.arguments.values())[1:]
+
+        def store(self, entry_key, result):
+            memo = self._memo
+            memo[entry_key] = (time.monotonic() + ttl, copy.copy(result))
+            memo.move_to_end(entry_key)
+            while len(memo) > self.memo_maxsize:
+                memo.popitem(last=False)
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            entry_key = memo_key(self, args, kwargs)
+            entry = self._memo.get(entry_key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._memo.move_to_end(entry_key)
+                    return copy.copy(entry[1])
+                del self._memo[entry_key]
+            result = await method(self, *args, **kwargs)
+            if result is not None:
+                store(self, entry_key, result)
+            return result
+
+        def inject(self, result, *args, **kwargs):
+            store(self, memo_key(self, args, kwargs), result)
+
+        wrapper.inject = inject
+        return wrapper
+    return decorator
+
+
+class _AimdLimiter:
+    """Concurrency limit adjusted by additive increase / multiplicative decrease."""
+
+    def __init__(self, limit: float, maximum: float):
+        self.limit = limit
+        self.maximum = maximum
+        self._active = 0
+        self._cond: Optional[asyncio.Condition] = None
+
+    def bind(self):
+        """Attach to the running event loop; call once per client session."""
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    def increase(self):
+        self.limit = min(self.maximum, self.limit + 0.5)
+
+    def decrease(self):
+        self.limit = max(1.0, self.limit * 0.5)
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < int(self.limit))
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+
+class _AsyncApiClient:
+    """Shared aiohttp session lifecycle for the API clients.
+
+    Use as ``async with client:`` and await the ``fetch_*`` coroutines, or
+    call the ``*_sync`` wrappers. These run on a shared background event loop
+    where the client keeps one session open until ``close()``, so connections
+    are reused across calls. Don't mix the two styles on one client.
+
+    Responses are cached on disk only when a ``cache_dir`` is given.
+    """
+
+    __slots__ = (
+        'session', '_session_loop', '_get', 'headers', 'cache', 'rate_limit', 'calls', 'paused_until',
+        'limiter', '_inflight', '_memo', '_missing'
+    )
+
+    base_url = ""
+    payload_key = "data"  # top-level key of a non-empty response
+    missing_ttl = 300  # seconds to remember that a request returned no data
+    max_concurrency = 20
+    max_retries = 3
+    backoff_factor = 0.3  # seconds; doubled on each retry
+    memo_maxsize = 1024  # memoized results kept per client
+
+    def __init__(self, rate_limit: int, cache_dir: Optional[str] = None):
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._get = None
+        self.headers: Dict[str, str] = {}
+        self.cache = FileCache(cache_dir) if cache_dir else None
+        self.rate_limit = rate_limit  # calls per minute
+        # Monotonic start times of the calls made in the last 60 seconds.
+        self.calls: deque = deque()
+        # No call may start before this monotonic time (set from rate-limit headers).
+        self.paused_until = 0.0
+        self.limiter = _AimdLimiter(limit=self.max_concurrency / 4, maximum=self.max_concurrency)
+        # Identical requests currently in flight, so concurrent callers share one.
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        # Per-process results of memoized fetchers in LRU order: key -> (monotonic expiry, result).
+        self._memo: OrderedDict = OrderedDict()
+        # Requests that came back with no data: cache key -> monotonic expiry.
+        self._missing: Dict[str, float] = {}
+
+    async def __aenter__(self):
+        if self.session is not None:
+            raise RuntimeError("Client session is already open")
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=_acquire_connector(),
+            connector_owner=False,
+        )
+        self._session_loop = asyncio.get_running_loop()
+        self._get = self.session.get
+        self._inflight = {}
+        self.limiter.bind()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+        self._session_loop = None
+        self._get = None
+        await _release_connector()
+
+    async def _rate_limit_check(self):
+        """Enforce rate limiting: at most ``rate_limit`` calls in any 60 seconds."""
+        while True:
+            now = time.monotonic()
+            while self.calls and now - self.calls[0] >= 60:
+                self.calls.popleft()
+            wait = self.paused_until - now
+            if len(self.calls) >= self.rate_limit:
+                wait = max(wait, 60 - (now - self.calls[0]))
+            if wait <= 0:
+                break
+            # Re-check after waking: other coroutines may have taken the free slot.
+            await asyncio.sleep(wait)
+        self.calls.append(now)
+
+    def _pause(self, seconds: float):
+        """Hold back every call for at least ``seconds`` from now."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def _observe_rate_limit_headers(self, response: aiohttp.ClientResponse):
+        """Pause proactively when the server reports its quota is (nearly) exhausted."""
+        try:
+            retry_after = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            retry_after = 60 / self.rate_limit
+        try:
+            remaining = int(response.headers["X-RateLimit-Remaining"])
+        except (KeyError, ValueError):
+            remaining = None
+        if response.status == 429 or (remaining is not None and remaining <= 2):
+            self._pause(retry_after)
+
+    def _cache_key(self, endpoint: str, params: Optional[Dict]) -> str:
+        raw = f"{self.base_url}{endpoint}|{sorted((params or {}).items())}"
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    async def _remember_missing(self, key: str):
+        """Answer ``key`` with ``{}`` for ``missing_ttl`` seconds, in memory and on disk."""
+        now = time.monotonic()
+        if len(self._missing) >= self.memo_maxsize:
+            self._missing = {k: t for k, t in self._missing.items() if t > now}
+        self._missing[key] = now + self.missing_ttl
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.set, key, _MISSING, self.missing_ttl)
+
+    async def _make_request(
+        self, endpoint: str, params: Optional[Dict] = None, cache_ttl: Optional[float] = None
+    ) -> Dict:
+        """Make an API request, joining an identical request already in flight."""
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(endpoint, params, cache_ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel the request for the others.
+        return await asyncio.shield(task)
+
+    async def _send_request(
+        self, endpoint: str, params: Optional[Dict], cache_ttl: Optional[float]
+    ) -> Dict:
+        """Make an API request with rate limiting, backoff and retries.
+
+        A 404 or empty response is remembered for ``missing_ttl`` seconds and
+        answered with ``{}`` until then, with or without a disk cache. When
+        ``cache_ttl`` is given, a successful response is cached on disk for
+        that many seconds and served from there without a request. Once an
+        entry expires it is revalidated with ``If-None-Match``, and a 304
+        reuses the cached body.
+        """
+        if self.session is None:
+            raise RuntimeError("Client session is not open; use 'async with client:'")
+        key = self._cache_key(endpoint, params)
+        expires = self._missing.get(key)
+        if expires is not None:
+            if expires > time.monotonic():
+                return {}
+            del self._missing[key]
+        headers = None
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return {} if cached == _MISSING else cached
+            if cache_ttl is not None:
+                stale, etag = await asyncio.to_thread(self.cache.get_stale, key)
+                if etag is not None:
+                    headers = {"If-None-Match": etag}
+
+        url = self.base_url + endpoint
+        get = self._get
+        for attempt in range(self.max_retries + 1):
+            await self._rate_limit_check()
+            try:
+                async with self.limiter:
+                    async with get(url, params=params, headers=headers) as response:
+                        self._observe_rate_limit_headers(response)
+                        error = f"HTTP {response.status}"
+                        if response.status == 304 and headers is not None:
+                            self.limiter.increase()
+                            await asyncio.to_thread(
+                                self.cache.set, key, stale, cache_ttl, headers["If-None-Match"]
+                            )
+                            return stale
+                        if response.status not in _RETRY_STATUSES:
+                            response.raise_for_status()
+                            self.limiter.increase()
+                            body = await response.read()
+                            payload = _json_loads(body) if body else {}
+                            if not payload or self.payload_key not in payload:
+                                await self._remember_missing(key)
+                            elif self.cache is not None and cache_ttl is not None:
+                                await asyncio.to_thread(
+                                    self.cache.set, key, payload, cache_ttl, response.headers.get("ETag")
+                                )
+                            return payload
+            except aiohttp.ClientResponseError as e:
+                if e.status >= 500:
+                    self.limiter.decrease()
+                elif e.status == 404:
+                    await self._remember_missing(key)
+                logger.error("Error making request to %s: %s", endpoint, e)
+                return {}
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = e
+            except (aiohttp.ClientError, ValueError) as e:
+                logger.error("Error making request to %s: %s", endpoint, e)
+                return {}
+            # Transient failure: shrink concurrency and retry with exponential backoff.
+            # A 429 has additionally paused the client for Retry-After.
+            self.limiter.decrease()
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+        logger.error(
+            "Error making request to %s: %s (gave up after %d retries)", endpoint, error, self.max_retries
+        )
+        return {}
+
+    def _run_sync(self, method, *args, **kwargs):
+        """Run an async fetch method to completion from synchronous code.
+
+        Works from any thread, including one with a running loop (Jupyter).
+        """
+        loop = _get_background_loop()
         try:
-            response = self.session.get(f"{self.base_url}{endpoint}", params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error making request to {endpoint}: {e}")
-            return {}
-
-    def fetch_pool_metrics(self, network: str, pool_address: str) -> Optional[Dict]:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("Sync wrappers cannot be called from the background loop itself")
+
+        async def runner():
+            # Only ever runs on the background loop, so opening the session is race-free.
+            if self.session is None:
+                await self.__aenter__()
+            elif self._session_loop is not loop:
+                raise RuntimeError("Client session is open on another event loop")
+            return await method(*args, **kwargs)
+
+        return asyncio.run_coroutine_threadsafe(runner(), loop).result()
+
+    def close(self):
+        """Close the session opened by the sync wrappers, if any."""
+        loop = _background_loop
+        if loop is not None and self.session is not None and self._session_loop is loop:
+            asyncio.run_coroutine_threadsafe(self.__aexit__(None, None, None), loop).result()
+
+
+class GeckoTerminalClient(_AsyncApiClient):
+    __slots__ = ()
+
+    base_url = "https://api.geckoterminal.com/api/v2"
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        super().__init__(rate_limit=30, cache_dir=cache_dir)
+
+    @memoize_with_injection(ttl=60)
+    async def fetch_pool_metrics(self, network: str, pool_address: str) -> Optional[Dict]:
         """Fetch TVL and 24h volume for a specific pool."""
         endpoint = f"/networks/{network}/pools/{pool_address}"
-        response = self._make_request(endpoint)
+        response = await self._make_request(endpoint, cache_ttl=60)
         if not response or 'data' not in response or 'attributes' not in response['data']:
-            print(f"No data found for pool {pool_address} on {network}")
+            logger.warning("No data found for pool %s on %s", pool_address, network)
             return None
 
         attributes = response['data']['attributes']
@@ -54,47 +561,89 @@ class GeckoTerminalClient:
                 'volume_24h_usd': volume,
                 'fetch_timestamp': int(time.time())
             }
-        except (ValueError, TypeError) as e:
-            print(f"Error processing metrics for pool {pool_address} on {network}: {e}")
+        except (ValueError, TypeError):
+            logger.exception("Error processing metrics for pool %s on %s", pool_address, network)
             return None
 
-    def fetch_multi_pool_metrics(self, network: str, pool_addresses: List[str]) -> List[Dict]:
-        """Fetch TVL and 24h volume for multiple pools."""
+    async def fetch_many_pool_metrics(
+        self, network: str, pool_addresses: List[str]
+    ) -> List[Optional[Dict]]:
+        """Fetch TVL and 24h volume for several pools, aligned with the input order."""
+        metrics = await self.fetch_pool_metrics_batched(network, pool_addresses)
+        by_address = {
+            address.lower(): row
+            for address, row in zip(metrics['pool_address'], metrics.to_dict('records'))
+        }
+        return [by_address.get(address.lower()) for address in pool_addresses]
+
+    async def fetch_pool_metrics_batched(
+        self, network: str, pool_addresses: List[str], chunk_size: int = 30
+    ) -> pd.DataFrame:
+        """Fetch TVL and 24h volume for any number of pools via the multi endpoint.
+
+        ``chunk_size`` is the number of pools per request, at most 30.
+        """
+        if not 1 <= chunk_size <= 30:
+            raise ValueError(f"chunk_size must be between 1 and 30, got {chunk_size}")
+        fetch_ts = int(time.time())
+        chunks = [
+            pool_addresses[i:i + chunk_size]
+            for i in range(0, len(pool_addresses), chunk_size)
+        ]
+        frames = await asyncio.gather(
+            *[self.fetch_multi_pool_metrics(network, chunk, fetch_ts=fetch_ts) for chunk in chunks]
+        )
+        # Empty chunks would degrade every column to object dtype in concat.
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=_METRICS_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+    async def fetch_multi_pool_metrics(
+        self, network: str, pool_addresses: List[str], fetch_ts: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Fetch TVL and 24h volume for up to 30 pools in one request.
+
+        Unparseable TVL or volume values come back as NaN.
+        """
         if not pool_addresses:
-            return []
+            return pd.DataFrame(columns=_METRICS_COLUMNS)
 
         pool_addresses_str = ",".join(pool_addresses)
         endpoint = f"/networks/{network}/pools/multi/{pool_addresses_str}"
-        response = self._make_request(endpoint)
-        results = []
+        response = await self._make_request(endpoint, cache_ttl=60)
         if not response or 'data' not in response:
-            print(f"No data found for pools on {network}")
-            return results
+            logger.warning("No data found for pools on %s", network)
+            return pd.DataFrame(columns=_METRICS_COLUMNS)
 
-        for pool_data in response['data']:
-            try:
-                attributes = pool_data.get('attributes', {})
-                pool_address = attributes.get('address', '')
-                tvl = float(attributes.get('reserve_in_usd', 0))
-                volume = float(attributes.get('volume_usd', {}).get('h24', 0))
-                results.append({
-                    'network': network,
-                    'pool_address': pool_address,
-                    'tvl_usd': tvl,
-                    'volume_24h_usd': volume,
-                    'fetch_timestamp': int(time.time())
-                })
-            except (ValueError, TypeError) as e:
-                print(f"Error processing metrics for pool {pool_address} on {network}: {e}")
-                continue
-        return results
+        if fetch_ts is None:
+            fetch_ts = int(time.time())
+        attributes = [pool_data.get('attributes') or {} for pool_data in response['data']]
+        count = len(attributes)
+        return pd.DataFrame({
+            'network': network,
+            'pool_address': [attrs.get('address', '') for attrs in attributes],
+            'tvl_usd': np.fromiter(
+                (_as_float(attrs.get('reserve_in_usd', 0)) for attrs in attributes),
+                dtype=np.float64, count=count
+            ),
+            'volume_24h_usd': np.fromiter(
+                (_as_float((attrs.get('volume_usd') or {}).get('h24', 0)) for attrs in attributes),
+                dtype=np.float64, count=count
+            ),
+            'fetch_timestamp': fetch_ts
+        }, columns=_METRICS_COLUMNS)
 
-    def fetch_pool_ohlcv(
+    @memoize_with_injection(ttl=60)
+    async def fetch_pool_ohlcv(
         self, network: str, pool_address: str, timeframe: str = "day",
         aggregate: int = 1, before_timestamp: Optional[int] = None,
         limit: int = 100, currency: str = "usd", token: str = "base"
-    ) -> Optional[List[Dict]]:
-        """Fetch OHLCV data for a specific pool."""
+    ) -> Optional[np.ndarray]:
+        """Fetch OHLCV data for a specific pool as an ``OHLCV_DTYPE`` record array.
+
+        Use ``ohlcv_to_dataframe`` where a DataFrame is needed.
+        """
         if network == "ethereum":
             network = "eth"
         endpoint = f"/networks/{network}/pools/{pool_address}/ohlcv/{timeframe}"
@@ -106,68 +655,97 @@ class GeckoTerminalClient:
         }
         if before_timestamp:
             params["before_timestamp"] = before_timestamp
+        # Candles that closed before yesterday are final; recent ones still change.
+        historical = before_timestamp and before_timestamp < time.time() - 86400
+        cache_ttl = math.inf if historical else 60
 
-        response = self._make_request(endpoint, params=params)
+        response = await self._make_request(endpoint, params=params, cache_ttl=cache_ttl)
         if not response or 'data' not in response or 'attributes' not in response['data']:
-            print(f"No OHLCV data found for pool {pool_address} on {network}")
+            logger.warning("No OHLCV data found for pool %s on %s", pool_address, network)
             return None
 
         try:
             ohlcv_data = response['data']['attributes']['ohlcv_list']
-            results = [
-                {
-                    'timestamp': int(data[0]),
-                    'datetime': pd.to_datetime(int(data[0]), unit='s'),
-                    'open': float(data[1]),
-                    'high': float(data[2]),
-                    'low': float(data[3]),
-                    'close': float(data[4]),
-                    'volume': float(data[5])
-                }
-                for data in ohlcv_data
-            ]
-            return results
-        except (KeyError, ValueError, TypeError) as e:
-            print(f"Error processing OHLCV data for pool {pool_address} on {network}: {e}")
+            raw = np.asarray(ohlcv_data, dtype=np.float64).reshape(-1, 6)
+            ohlcv = np.empty(len(raw), dtype=OHLCV_DTYPE)
+            ohlcv['ts'] = raw[:, 0].astype(np.int64)
+            ohlcv['o'] = raw[:, 1]
+            ohlcv['h'] = raw[:, 2]
+            ohlcv['l'] = raw[:, 3]
+            ohlcv['c'] = raw[:, 4]
+            ohlcv['v'] = raw[:, 5]
+            return ohlcv
+        except (KeyError, ValueError, TypeError):
+            logger.exception("Error processing OHLCV data for pool %s on %s", pool_address, network)
             return None
 
-class YieldSamuraiClient:
-    def __init__(self, api_key: Optional[str] = None):
-        self.base_url = "https://api.yieldsamurai.com/v1"
-        self.session = requests.Session()
-        self.rate_limit = 10  # calls per minute (demo limit)
-        self.calls = []
+    async def fetch_many_pool_ohlcv(
+        self, network: str, pool_addresses: List[str], **kwargs
+    ) -> List[Optional[np.ndarray]]:
+        """Fetch OHLCV data for several pools, aligned with the input order.
+
+        At most ``rate_limit // 2`` fetches are started at once; within that,
+        the AIMD limiter decides how many requests are actually in flight.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.rate_limit // 2))
+
+        async def bounded(pool_address: str) -> Optional[np.ndarray]:
+            async with semaphore:
+                return await self.fetch_pool_ohlcv(network, pool_address, **kwargs)
+
+        return list(await asyncio.gather(*[bounded(address) for address in pool_addresses]))
+
+    def inject_pool_metrics(self, network: str, pool_address: str, metrics: Dict):
+        """Seed fetch_pool_metrics with a snapshot the caller already has."""
+        type(self).fetch_pool_metrics.inject(self, metrics, network, pool_address)
+
+    def inject_pool_ohlcv(self, network: str, pool_address: str, ohlcv: np.ndarray, **kwargs):
+        """Seed fetch_pool_ohlcv; ``kwargs`` must match the arguments it will be called with."""
+        type(self).fetch_pool_ohlcv.inject(self, ohlcv, network, pool_address, **kwargs)
+
+    def fetch_pool_metrics_sync(self, *args, **kwargs) -> Optional[Dict]:
+        return self._run_sync(self.fetch_pool_metrics, *args, **kwargs)
+
+    def fetch_many_pool_metrics_sync(self, *args, **kwargs) -> List[Optional[Dict]]:
+        return self._run_sync(self.fetch_many_pool_metrics, *args, **kwargs)
+
+    def fetch_pool_metrics_batched_sync(self, *args, **kwargs) -> pd.DataFrame:
+        return self._run_sync(self.fetch_pool_metrics_batched, *args, **kwargs)
+
+    def fetch_multi_pool_metrics_sync(self, *args, **kwargs) -> pd.DataFrame:
+        return self._run_sync(self.fetch_multi_pool_metrics, *args, **kwargs)
+
+    def fetch_pool_ohlcv_sync(self, *args, **kwargs) -> Optional[np.ndarray]:
+        return self._run_sync(self.fetch_pool_ohlcv, *args, **kwargs)
+
+    def fetch_many_pool_ohlcv_sync(self, *args, **kwargs) -> List[Optional[np.ndarray]]:
+        return self._run_sync(self.fetch_many_pool_ohlcv, *args, **kwargs)
+
+
+class YieldSamuraiClient(_AsyncApiClient):
+    __slots__ = ('api_key',)
+
+    base_url = "https://api.yieldsamurai.com/v1"
+    payload_key = "records"
+
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None):
+        super().__init__(rate_limit=10, cache_dir=cache_dir)  # demo limit
         self.api_key = api_key
         # Demo headers
-        self.session.headers.update({
+        self.headers.update({
             "accept": "application/json",
             "Authorization": "demo" if not api_key else f"Bearer {api_key}"
         })
 
-    def _rate_limit_check(self):
-        """Enforce rate limiting: 10 calls per minute."""
-        current_time = time.time()
-        self.calls = [call for call in self.calls if current_time - call < 60]
-        if len(self.calls) >= self.rate_limit:
-            sleep_time = 60 - (current_time - self.calls[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        self.calls.append(current_time)
-
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+    async def _make_request(
+        self, endpoint: str, params: Optional[Dict] = None, cache_ttl: Optional[float] = None
+    ) -> Dict:
         """Make an API request with rate limiting."""
-        self._rate_limit_check()
-        try:
-            url = f"{self.base_url}{endpoint}"
-            print(f"YieldSamurai request: {url} with params {params}")
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error making request to {endpoint}: {e}")
-            return {}
-
-    def fetch_tvl(
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("YieldSamurai request: %s%s with params %s", self.base_url, endpoint, params)
+        return await super()._make_request(endpoint, params, cache_ttl)
+
+    async def fetch_tvl(
         self, chain: str, pool_address: str, days: int = 7, interval: str = "hourly"
     ) -> Optional[List[Dict]]:
         """Fetch historical TVL for a pool (7 days max for demo)."""
@@ -176,27 +754,34 @@ class YieldSamuraiClient:
             "days": min(days, 7),  # Enforce demo limit
             "interval": interval
         }
-        response = self._make_request(endpoint, params)
+        response = await self._make_request(endpoint, params, cache_ttl=60)
         if not response or 'records' not in response:
-            print(f"No TVL data found for pool {pool_address} on {chain}")
+            logger.warning("No TVL data found for pool %s on %s", pool_address, chain)
             return None
 
+        records = response['records']
+        if not records:
+            return []
+
+        rows = []
+        results = []
         try:
-            results = [
-                {
-                    'timestamp': int(record['timestamp']),
-                    'datetime': pd.to_datetime(int(record['timestamp']), unit='s'),
-                    'tvl_usd': float(record['tvl']['totalUsd'])
-                }
-                for record in response['records']
-            ]
-            # Save to CSV
-            if results:
-                tvl_df = pd.DataFrame(results)
-                tvl_csv = f"yieldsamurai_tvl_{chain}_{pool_address[:6]}.csv"
-                tvl_df.to_csv(tvl_csv, index=False)
-                print(f"YieldSamurai TVL saved to {tvl_csv}")
-            return results
-        except (KeyError, ValueError, TypeError) as e:
-            print(f"Error processing TVL data for pool {pool_address} on {chain}: {e}")
-            return None
\ No newline at end of file
+            for record in records:
+                ts = int(record['timestamp'])
+                tvl = float(record['tvl']['totalUsd'])
+                rows.append((ts, time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(ts)), tvl))
+                results.append({
+                    'timestamp': ts,
+                    'datetime': np.datetime64(ts, 's'),
+                    'tvl_usd': tvl
+                })
+        except (KeyError, ValueError, TypeError):
+            logger.exception("Error processing TVL data for pool %s on %s", pool_address, chain)
+            return None
+        tvl_csv = f"yieldsamurai_tvl_{chain}_{pool_address[:6]}.csv"
+        await asyncio.to_thread(_write_csv, tvl_csv, ('timestamp', 'datetime', 'tvl_usd'), rows)
+        logger.info("YieldSamurai TVL saved to %s", tvl_csv)
+        return results
+
+    def fetch_tvl_sync(self, *args, **kwargs) -> Optional[List[Dict]]:
+        return self._run_sync(self.fetch_tvl, *args, **kwargs)
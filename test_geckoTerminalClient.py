@@ -0,0 +1,194 @@
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+
+import geckoTerminalClient as gtc
+from geckoTerminalClient import GeckoTerminalClient
+
+POOL = {"data": {"attributes": {"reserve_in_usd": "100.5", "volume_usd": {"h24": "7"}}}}
+
+
+class FakeClock:
+    """Virtual ``time.monotonic`` for the client; a sleep moves the clock to its deadline instead of waiting."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay, result=None):
+        self.now += max(delay, 0)
+        await asyncio.sleep(0)
+        return result
+
+
+class _Patched:
+    """``module`` with some attributes replaced, so the patch stays local to the client."""
+
+    def __init__(self, module, **overrides):
+        self._module = module
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(gtc, "time", _Patched(gtc.time, monotonic=clock.monotonic))
+    monkeypatch.setattr(gtc, "asyncio", _Patched(asyncio, sleep=clock.sleep))
+    return clock
+
+
+def run_with_server(handler, scenario, **client_kwargs):
+    """Serve ``handler`` for every path and run ``scenario(client, hits)`` against it."""
+    hits = []
+
+    async def record(request):
+        hits.append(request)
+        return await handler(request, len(hits))
+
+    async def main():
+        app = web.Application()
+        app.router.add_route("GET", "/{tail:.*}", record)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        client = GeckoTerminalClient(**client_kwargs)
+        try:
+            with pytest.MonkeyPatch.context() as mp:
+                mp.setattr(GeckoTerminalClient, "base_url", f"http://127.0.0.1:{port}")
+                async with client:
+                    return await scenario(client, hits)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_rate_limit_window(clock):
+    client = GeckoTerminalClient()
+    starts = []
+
+    async def call():
+        await client._rate_limit_check()
+        starts.append(clock.now)
+
+    async def main():
+        await asyncio.gather(*[call() for _ in range(75)])
+
+    asyncio.run(main())
+    starts.sort()
+    for i, start in enumerate(starts):
+        assert sum(1 for t in starts[i:] if t - start < 60) <= client.rate_limit
+    # 75 calls at 30 per minute need two full windows, and no more.
+    assert starts[-1] - starts[0] == pytest.approx(120)
+
+
+def test_retry_after_pauses_then_retries(clock):
+    async def handler(request, n):
+        if n == 1:
+            return web.Response(status=429, headers={"Retry-After": "7"})
+        return web.json_response(POOL)
+
+    async def scenario(client, hits):
+        return await client.fetch_pool_metrics("eth", "0xabc"), len(hits)
+
+    metrics, hit_count = run_with_server(handler, scenario)
+    assert hit_count == 2
+    assert metrics["tvl_usd"] == 100.5
+    assert clock.now - 1000.0 >= 7
+
+
+def test_404_is_remembered_without_disk_cache(clock):
+    async def handler(request, n):
+        return web.Response(status=404)
+
+    async def scenario(client, hits):
+        first = await client.fetch_pool_metrics("eth", "0xdead")
+        second = await client.fetch_pool_metrics("eth", "0xdead")
+        remembered = len(hits)
+        clock.now += client.missing_ttl + 1
+        await client.fetch_pool_metrics("eth", "0xdead")
+        return first, second, remembered, len(hits)
+
+    first, second, remembered, total = run_with_server(handler, scenario)
+    assert first is None and second is None
+    assert remembered == 1
+    assert total == 2
+
+
+def test_304_reuses_cached_body(clock, tmp_path):
+    async def handler(request, n):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response(POOL, headers={"ETag": '"v1"'})
+
+    async def scenario(client, hits):
+        endpoint = "/networks/eth/pools/0xabc"
+        first = await client._make_request(endpoint, cache_ttl=0)
+        second = await client._make_request(endpoint, cache_ttl=0)
+        return first, second, [h.headers.get("If-None-Match") for h in hits]
+
+    first, second, etags = run_with_server(handler, scenario, cache_dir=str(tmp_path))
+    assert first == second == POOL
+    assert etags == [None, '"v1"']
+
+
+def test_identical_concurrent_calls_share_one_request(clock):
+    async def handler(request, n):
+        await asyncio.sleep(0)
+        return web.json_response(POOL)
+
+    async def scenario(client, hits):
+        results = await asyncio.gather(*[client._make_request("/networks/eth/pools/0xabc") for _ in range(10)])
+        return results, len(hits)
+
+    results, hit_count = run_with_server(handler, scenario)
+    assert hit_count == 1
+    assert all(result == POOL for result in results)
+
+
+def test_sync_wrappers_reuse_one_connection():
+    peers = set()
+    ready = threading.Event()
+    loop = asyncio.new_event_loop()
+
+    async def handler(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response(POOL)
+
+    async def start():
+        app = web.Application()
+        app.router.add_route("GET", "/{tail:.*}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        return runner
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        serve.runner = loop.run_until_complete(start())
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    port = serve.runner.addresses[0][1]
+    client = GeckoTerminalClient()
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(GeckoTerminalClient, "base_url", f"http://127.0.0.1:{port}")
+            results = [client.fetch_pool_metrics_sync("eth", f"0x{i}") for i in range(3)]
+    finally:
+        client.close()
+        asyncio.run_coroutine_threadsafe(serve.runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+    assert [result["pool_address"] for result in results] == ["0x0", "0x1", "0x2"]
+    assert len(peers) == 1